@@ -5,7 +5,8 @@ from datetime import timedelta
 from typing import Any, Dict, Set
 
 from homeassistant.config_entries import ConfigEntry  # type: ignore
-from homeassistant.core import HomeAssistant  # type: ignore
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP  # type: ignore
+from homeassistant.core import Event, HomeAssistant  # type: ignore
 from homeassistant.exceptions import ConfigEntryNotReady  # type: ignore
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed  # type: ignore
 from homeassistant.helpers import config_validation as cv, device_registry as dr  # type: ignore
@@ -18,6 +19,9 @@ _LOGGER = logging.getLogger(__name__)
 # This integration only supports config entries, no YAML configuration
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Platforms set up for each config entry (v2 uses sensor and select only)
+PLATFORMS = ["sensor", "select"]
+
 class ArubaSwitchCoordinator(DataUpdateCoordinator):
     """Coordinator to manage single SSH session and update all entities."""
     
@@ -175,7 +179,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Set up platforms (using new v2 architecture)
     _LOGGER.info("Setting up platforms for %s", entry.data["host"])
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "select"])
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     _LOGGER.info("All platforms setup completed for %s", entry.data["host"])
     
     # Add update listener for options flow
@@ -183,6 +187,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     _LOGGER.info("Update listener added for %s", entry.data["host"])
     
+    # Entries aren't unloaded on shutdown, so log out of the switch when Home Assistant stops
+    async def _async_close_session(event: Event) -> None:
+        await coordinator.ssh_manager.close()
+    
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_session))
+    
     _LOGGER.info("Aruba Switch setup COMPLETED successfully for %s", entry.data["host"])
     return True
 
@@ -194,17 +204,11 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Unload all active platforms (v2 uses sensor and select only)
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in ["sensor", "select"]
-            ]
-        )
-    )
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        # Remove the config entry from hass.data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Remove the config entry from hass.data and drop its SSH session
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.ssh_manager.close()
     
     return unload_ok
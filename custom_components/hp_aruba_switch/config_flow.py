@@ -56,9 +56,7 @@ async def validate_input(hass: HomeAssistant, data: dict) -> dict:
                     _LOGGER.debug(f"Error closing SSH connection during validation: {e}")
     
     # Run connection test in executor
-    import asyncio
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, _test_connection)
+    await hass.async_add_executor_job(_test_connection)
     
     # Return info that you want to store in the config entry
     return {"title": f"Aruba Switch ({host}:{ssh_port})"}
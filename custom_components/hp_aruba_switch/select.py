@@ -3,8 +3,8 @@ import asyncio
 import logging
 from typing import Any, Dict, Optional
 
-import paramiko  # type: ignore
 from homeassistant.components.select import SelectEntity  # type: ignore
+from homeassistant.exceptions import HomeAssistantError  # type: ignore
 from homeassistant.helpers.restore_state import RestoreEntity  # type: ignore
 
 from .const import DOMAIN
@@ -97,7 +97,7 @@ class ArubaPortControl(ArubaSwitchEntity, SelectEntity, RestoreEntity):
         
         if self._has_poe:
             poe_enabled = poe_data.get("power_enable", False)
-            poe_status = poe_data.get("poe_status", "").lower()
+            poe_status = poe_data.get("poe_status", "off").lower()
             
             if poe_enabled and poe_status in ["delivering", "searching", "enabled"]:
                 return "enabled_poe_on"
@@ -132,6 +132,7 @@ class ArubaPortControl(ArubaSwitchEntity, SelectEntity, RestoreEntity):
                 await self._enable_poe()
             
             # Request coordinator refresh after change
+            self.coordinator.ssh_manager.invalidate_cache()
             await asyncio.sleep(2)  # Wait for switch to process
             await self.coordinator.async_request_refresh()
             
@@ -140,41 +141,25 @@ class ArubaPortControl(ArubaSwitchEntity, SelectEntity, RestoreEntity):
     
     async def _enable_port(self) -> None:
         """Enable the port administratively."""
-        ssh_manager = self.coordinator.ssh_manager
-        commands = f"configure\\ninterface {self._port}\\nenable\\nexit\\nexit\\n"
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._sync_execute_commands, ssh_manager, commands)
+        await self._execute_commands(f"configure\ninterface {self._port}\nenable\nexit\nexit")
     
     async def _disable_port(self) -> None:
         """Disable the port administratively."""
-        ssh_manager = self.coordinator.ssh_manager
-        commands = f"configure\\ninterface {self._port}\\ndisable\\nexit\\nexit\\n"
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._sync_execute_commands, ssh_manager, commands)
+        await self._execute_commands(f"configure\ninterface {self._port}\ndisable\nexit\nexit")
     
     async def _enable_poe(self) -> None:
         """Enable PoE on the port."""
         if not self._has_poe:
             return
         
-        ssh_manager = self.coordinator.ssh_manager
-        commands = f"configure\\ninterface {self._port}\\npower-over-ethernet\\nexit\\nexit\\n"
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._sync_execute_commands, ssh_manager, commands)
+        await self._execute_commands(f"configure\ninterface {self._port}\npower-over-ethernet\nexit\nexit")
     
     async def _disable_poe(self) -> None:
         """Disable PoE on the port."""
         if not self._has_poe:
             return
         
-        ssh_manager = self.coordinator.ssh_manager
-        commands = f"configure\\ninterface {self._port}\\nno power-over-ethernet\\nexit\\nexit\\n"
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._sync_execute_commands, ssh_manager, commands)
+        await self._execute_commands(f"configure\ninterface {self._port}\nno power-over-ethernet\nexit\nexit")
     
     async def _set_poe_auto(self) -> None:
         """Set PoE to auto mode (let switch decide)."""
@@ -182,65 +167,16 @@ class ArubaPortControl(ArubaSwitchEntity, SelectEntity, RestoreEntity):
             return
         
         # For most HP/Aruba switches, removing explicit config enables auto
-        ssh_manager = self.coordinator.ssh_manager
-        commands = f"configure\\ninterface {self._port}\\nno power-over-ethernet\\npower-over-ethernet\\nexit\\nexit\\n"
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._sync_execute_commands, ssh_manager, commands)
-    
-    def _sync_execute_commands(self, ssh_manager, commands: str) -> None:
-        """Execute commands synchronously (runs in executor)."""
-        import time
-        
-        ssh = None
-        try:
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(
-                hostname=ssh_manager.host,
-                port=ssh_manager.ssh_port,
-                username=ssh_manager.username,
-                password=ssh_manager.password,
-                timeout=15,
-                look_for_keys=False,
-                allow_agent=False
-            )
-            
-            shell = ssh.invoke_shell()
-            shell.send('\\n')
-            time.sleep(0.5)
-            
-            shell.send('no page\\n')
-            time.sleep(0.5)
-            
-            if shell.recv_ready():
-                shell.recv(4096)
-            
-            # Send commands
-            for cmd in commands.split('\\n'):
-                if cmd.strip():
-                    shell.send(cmd.strip() + '\\n')
-                    time.sleep(0.8)
-            
-            time.sleep(1)
-            
-            # Collect output
-            output = ""
-            if shell.recv_ready():
-                output = shell.recv(4096).decode('utf-8', errors='ignore')
-            
-            shell.close()
-            _LOGGER.debug(f"Port control commands executed: {output[:200]}")
-            
-        except Exception as e:
-            _LOGGER.error(f"Failed to execute port control commands: {e}")
-            raise
-        finally:
-            if ssh:
-                try:
-                    ssh.close()
-                except Exception:
-                    pass
+        await self._execute_commands(
+            f"configure\ninterface {self._port}\nno power-over-ethernet\npower-over-ethernet\nexit\nexit"
+        )
+    
+    async def _execute_commands(self, commands: str) -> None:
+        """Run configuration commands over the switch's shared SSH session."""
+        output = await self.coordinator.ssh_manager.execute_command(commands)
+        if output is None:
+            raise HomeAssistantError(f"Failed to execute port control commands on port {self._port}")
+        _LOGGER.debug(f"Port control commands executed: {output[:200]}")
     
     @property
     def icon(self) -> str:
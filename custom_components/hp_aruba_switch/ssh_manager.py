@@ -1,14 +1,242 @@
 """SSH connection manager for Aruba Switch integration."""
 import logging
 import asyncio
+import concurrent.futures
+import re
+import socket
+import threading
 import paramiko
 from typing import Optional, Dict, Any
 import time
 
 _LOGGER = logging.getLogger(__name__)
 
-# Global semaphore to limit concurrent SSH connections across all instances
-_CONNECTION_SEMAPHORE = asyncio.Semaphore(3)  # Max 3 concurrent SSH connections
+# Dedicated worker pool for blocking SSH I/O so slow switches can't starve Home
+# Assistant's shared default executor. Each manager serializes its own switch with
+# _connection_lock, so this only bounds how many switches are polled at once.
+_SSH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="aruba-ssh")
+
+# Seconds between SSH keepalive packets on the persistent session
+_SSH_KEEPALIVE_INTERVAL = 30
+
+# 'show interface all' (per-port counters) is slow to produce, so it only runs on every
+# Nth refresh; 'show interface brief' keeps link and admin state current in between
+_FULL_POLL_INTERVAL = 5
+
+# ANSI escape sequences emitted by the switch CLI
+_RE_ANSI = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Optional CLI context and prompt character ending a prompt, e.g. "(config)# " or "(eth-1/5)#"
+_PROMPT_CONTEXT = r'(?:\([^)\r\n]*\))?[#>] ?$'
+# CLI prompt at the end of the output, e.g. "HP-2530-24G# " or "Core Switch(eth-1/5)# ";
+# group 1 is the hostname text the session's own prompt is learned from
+_RE_PROMPT = re.compile(r'(?:^|[\r\n])\s*([^\r\n()#>]*[^\s()#>])' + _PROMPT_CONTEXT)
+
+# Precompiled patterns for 'show interface all' parsing
+_RE_INTERFACE_HEADER = re.compile(r"(?:interface|port|gi|fa|te)[\s]*(\d+)")
+_RE_PORT_HEADER = re.compile(r"port[\s]*(\d+)")
+_RE_FLOAT = re.compile(r'(\d+(?:\.\d+)?)')
+_RE_UTILIZATION_TX = re.compile(r'utilization tx\s*:\s*([\d.]+)')
+
+# Per-port values before a port's 'show interface all' block has been parsed
+_INTERFACE_DEFAULTS: Dict[str, Any] = {
+    "port_enabled": False,
+    "link_status": "down",
+    "mac_address": "unknown",
+    "name": "",
+}
+_STATISTICS_DEFAULTS: Dict[str, Any] = {
+    "bytes_in": 0,
+    "bytes_out": 0,
+    "packets_in": 0,
+    "packets_out": 0,
+    "bytes_rx": 0,
+    "bytes_tx": 0,
+    "unicast_rx": 0,
+    "unicast_tx": 0,
+    "bcast_mcast_rx": 0,
+    "bcast_mcast_tx": 0,
+    # Error counters
+    "fcs_rx": 0,
+    "drops_tx": 0,
+    "alignment_rx": 0,
+    "collisions_tx": 0,
+    "runts_rx": 0,
+    "late_colln_tx": 0,
+    "giants_rx": 0,
+    "excessive_colln": 0,
+    "total_rx_errors": 0,
+    "deferred_tx": 0,
+    # Other counters
+    "discard_rx": 0,
+    "out_queue_len": 0,
+    "unknown_protos": 0,
+    # Rates (5 minute averages)
+    "total_rx_bps": 0,
+    "total_tx_bps": 0,
+    "unicast_rx_pps": 0,
+    "unicast_tx_pps": 0,
+    "bcast_mcast_rx_pps": 0,
+    "bcast_mcast_tx_pps": 0,
+    "utilization_rx_percent": 0.0,
+    "utilization_tx_percent": 0.0,
+}
+_LINK_DETAILS_DEFAULTS: Dict[str, Any] = {
+    "link_up": False,
+    "port_enabled": False,
+    "link_speed": "unknown",
+    "duplex": "unknown",
+}
+
+# 'show interface all' section headers, keyed by the text before " ("
+_INTERFACE_SECTIONS = {
+    "totals": "totals",
+    "errors": "errors",
+    "others": "others",
+    "rates": "rates",
+}
+
+# 'show interface all' counter lines: (section, key) -> statistics fields for the
+# first (Rx) and second (Tx) number on the line
+_INTERFACE_COUNTERS = {
+    ("totals", "bytes rx"): (("bytes_rx",), ("bytes_tx",)),
+    ("totals", "unicast rx"): (("unicast_rx", "packets_in"), ("unicast_tx", "packets_out")),
+    ("totals", "bcast/mcast rx"): (("bcast_mcast_rx",), ("bcast_mcast_tx",)),
+    ("totals", "b/mcast rx"): (("bcast_mcast_rx",), ("bcast_mcast_tx",)),
+    ("errors", "fcs rx"): (("fcs_rx",), ("drops_tx",)),
+    ("errors", "alignment rx"): (("alignment_rx",), ("collisions_tx",)),
+    ("errors", "runts rx"): (("runts_rx",), ("late_colln_tx",)),
+    ("errors", "giants rx"): (("giants_rx",), ("excessive_colln",)),
+    ("errors", "total rx errors"): (("total_rx_errors",), ("deferred_tx",)),
+    ("errors", "total errors"): (("total_rx_errors",), ("deferred_tx",)),
+    ("others", "discard rx"): (("discard_rx",), ("out_queue_len",)),
+    ("others", "unknown protos"): (("unknown_protos",),),
+    ("others", "unknown proto"): (("unknown_protos",),),
+    ("rates", "total rx (bps)"): (("total_rx_bps",), ("total_tx_bps",)),
+    ("rates", "unicast rx (pkts/sec)"): (("unicast_rx_pps",), ("unicast_tx_pps",)),
+    ("rates", "b/mcast rx (pkts/sec)"): (("bcast_mcast_rx_pps",), ("bcast_mcast_tx_pps",)),
+}
+
+# Precompiled patterns for 'show interface brief' and 'show version' parsing
+# 'show interface brief' row, e.g. "1  100/1000T | No  Yes  Up  1000FDx  MDIX off":
+# port and type left of the bar; alert, enabled, status, mode and optional MDI and flow control right of it
+_RE_BRIEF_ROW = re.compile(
+    r'^[ \t]*([A-Za-z]*\d[\w/.\-]*)(?:[ \t]+([^\s|]+))?[ \t]*\|'
+    r'[ \t]*(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)(?:[ \t]+(\S+))?(?:[ \t]+(\S+))?',
+    re.MULTILINE,
+)
+_RE_BRIEF_MODE = re.compile(r'(\d+)(FD|HD|F|H)?x?')
+_RE_FIRMWARE_VERSION = re.compile(r'[YK][A-Z]\.[\.\d]+', re.IGNORECASE)
+
+# Precompiled patterns for 'show power-over-ethernet all' parsing
+_RE_POE_PORT_LINE = re.compile(r'^\s*\d+(/\d+)?\s+')
+_RE_POE_PORT_NUM = re.compile(r'[\d/.]*\d[\d/.]*')
+_RE_POE_COLUMN_GAP = re.compile(r'\s{3,}')
+_RE_POE_DECIMAL = re.compile(r'([\d.]+)')
+_RE_POE_INTEGER = re.compile(r'(\d+)')
+# 'PoE Port Status' keywords and their normalised status, matched in one regex scan
+_POE_STATUS_MAP = {
+    "searching": "searching",
+    "deliver": "delivering",
+    "enabled": "on",
+    "on": "on",
+    "active": "on",
+    "fault": "fault",
+    "error": "fault",
+    "overload": "fault",
+    "denied": "denied",
+    "reject": "denied",
+}
+_RE_POE_STATUS = re.compile("|".join(_POE_STATUS_MAP))
+
+# PoE values for a port before its block has been parsed
+_POE_PORT_DEFAULTS: Dict[str, Any] = {
+    "power_enable": False,
+    "poe_status": "off",
+    "pse_voltage": 0.0,
+    "pd_amperage_draw": 0,
+    "pd_power_draw": 0.0,
+    "pse_reserved_power": 0.0,
+    "plc_class": "unknown",
+    "plc_type": "unknown",
+    "dlc_class": "unknown",
+    "dlc_type": "unknown",
+    "priority_config": "unknown",
+    "pre_std_detect": "unknown",
+    "lldp_pse_allocated": 0.0,
+    "lldp_pd_requested": 0.0,
+    "over_current_cnt": 0,
+    "power_denied_cnt": 0,
+    "short_cnt": 0,
+    "mps_absent_cnt": 0,
+}
+
+
+def _extract_numbers(text: str) -> list[int]:
+    """Extract comma-grouped counters such as '1,234,567' from text."""
+    # Counters are whitespace-separated tokens, so dropping the thousands separators
+    # and keeping the all-digit tokens avoids the regex engine entirely
+    return [int(token) for token in text.replace(",", "").split() if token.isdecimal()]
+
+
+def _extract_float(text: str) -> float:
+    """Extract floating point number from text."""
+    match = _RE_FLOAT.search(text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return 0.0
+
+
+def _parse_poe_port_header(line: str, line_lower: str) -> Optional[str]:
+    """Return the port number if the line starts a port's PoE block, otherwise None."""
+    # Header forms in order of preference; a match without a valid port number falls through
+    for pattern in ("information for port", "port status", "interface", "gi"):
+        if pattern in line_lower:
+            if "port" in pattern:
+                port_num = line.split("port")[-1].strip()
+            else:
+                parts = line.split()
+                port_num = parts[-1] if parts else ""
+            if _RE_POE_PORT_NUM.fullmatch(port_num):
+                return port_num
+    
+    # Tabular output: the line starts with the port number
+    if _RE_POE_PORT_LINE.match(line):
+        return line.split()[0]
+    return None
+
+
+def _parse_poe_fields(line: str) -> Dict[str, str]:
+    """Split a multi-column 'Key : Value   Key : Value' PoE line into lowercased keys and values.
+
+    Columns are separated by runs of three or more spaces, so a single left-to-right
+    pass over the colon-separated segments is enough (no backtracking regex).
+    """
+    fields: Dict[str, str] = {}
+    segments = line.split(':')
+    key = segments[0]
+    for segment in segments[1:-1]:
+        value_and_key = segment.strip()
+        parts = _RE_POE_COLUMN_GAP.split(value_and_key, 1)
+        if len(parts) == 2:
+            value, next_key = parts
+        elif _RE_POE_COLUMN_GAP.match(segment):
+            # Empty value followed directly by the next column
+            value, next_key = "", value_and_key
+        else:
+            # No column gap: the segment is part of the next key
+            key = segment
+            continue
+        if key.strip():
+            fields[key.strip().lower()] = value
+        key = next_key
+    if len(segments) > 1 and key.strip():
+        fields[key.strip().lower()] = segments[-1].strip()
+    return fields
+
 
 class ArubaSSHManager:
     """Manages SSH connections to Aruba switches with connection pooling and retry logic."""
@@ -27,216 +255,389 @@ class ArubaSSHManager:
         self._is_available = True
         self._last_successful_connection = 0
         
-    async def execute_command(self, command: str, timeout: int = 10) -> Optional[str]:
-        """Execute a command on the switch with proper connection management."""
-        # Use global semaphore to limit concurrent connections
-        async with _CONNECTION_SEMAPHORE:
-            # Use the lock directly as an async context manager
-            async with self._connection_lock:
-                # Minimal backoff to avoid overwhelming
-                time_since_last = time.time() - self._last_connection_attempt
-                if time_since_last < self._connection_backoff:
-                    await asyncio.sleep(self._connection_backoff - time_since_last)
+        # Persistent SSH session, reused across commands and reopened lazily
+        self._ssh: Optional[paramiko.SSHClient] = None
+        self._shell: Optional[paramiko.Channel] = None
+        self._connected_at = 0.0
+        # Prompt of the current session (hostname plus optional context), captured at connect
+        self._prompt_re: Optional[re.Pattern] = None
+        # SSH config that last connected, so reconnects skip the fallback probing
+        self._ssh_config: Optional[Dict[str, Any]] = None
+        
+        # Concurrent data requests share one in-flight fetch. invalidate_cache() bumps
+        # the version so requests made after a config write never join an older fetch.
+        self._bulk_task: Optional[asyncio.Task] = None
+        self._bulk_version = 0
+        self._data_version = 0
+        # Last successful result as (monotonic time, data version, data), served for
+        # _cache_ttl seconds. The refresh interval is at least 10s, so regular polls always fetch.
+        self._data_cache: Optional[tuple[float, int, tuple]] = None
+        self._cache_ttl = 5.0
+        
+        # Last parsed 'show interface all' result, reused between full polls
+        self._interface_all_cache: Optional[tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = None
+        self._polls_since_full_poll = 0
+        
+    def _is_connected(self) -> bool:
+        """Return True if the persistent SSH session is still usable."""
+        if self._ssh is None or self._shell is None or self._shell.closed:
+            return False
+        transport = self._ssh.get_transport()
+        return transport is not None and transport.is_active()
+
+    def _connect(self, timeout: int) -> None:
+        """Open the SSH session and prepare the interactive shell (runs in executor)."""
+        connect_params = {
+            'hostname': self.host,
+            'username': self.username,
+            'password': self.password,
+            'port': self.ssh_port,
+            'timeout': timeout,
+            'auth_timeout': 5,  # Reduced
+            'banner_timeout': 8,  # Reduced
+            'look_for_keys': False,
+            'allow_agent': False,
+        }
+        
+        # Simplified SSH configs - only try 2 instead of 3
+        ssh_configs = [
+            # Modern SSH
+            {},
+            # Legacy compatibility
+            {
+                'disabled_algorithms': {
+                    'kex': ['diffie-hellman-group14-sha256', 'diffie-hellman-group16-sha512'],
+                    'ciphers': [],
+                    'macs': []
+                }
+            }
+        ]
+        
+        if self._ssh_config is not None:
+            ssh_configs = [self._ssh_config]
+        
+        # Fall back to the generic prompt pattern until this session's prompt is known
+        self._prompt_re = None
+        
+        for i, config in enumerate(ssh_configs):
+            ssh = paramiko.SSHClient()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            try:
+                ssh.connect(**{**connect_params, **config})
+                # Keep the idle session open between refreshes; the switch drops silent sessions
+                ssh.get_transport().set_keepalive(_SSH_KEEPALIVE_INTERVAL)
                 
-                self._last_connection_attempt = time.time()
+                # Use invoke_shell for better switch compatibility
+                shell = ssh.invoke_shell()
+                # Block in recv() for short periods instead of sleeping between polls
+                shell.settimeout(0.5)
                 
-                def _sync_execute():
-                    ssh = None
-                    try:
-                        ssh = paramiko.SSHClient()
-                        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                        
-                        # Faster connection parameters
-                        connect_params = {
-                            'hostname': self.host,
-                            'username': self.username,
-                            'password': self.password,
-                            'port': self.ssh_port,
-                            'timeout': timeout,
-                            'auth_timeout': 5,  # Reduced
-                            'banner_timeout': 8,  # Reduced
-                            'look_for_keys': False,
-                            'allow_agent': False,
-                        }
-                        
-                        # Simplified SSH configs - only try 2 instead of 3
-                        ssh_configs = [
-                            # Modern SSH
-                            {},
-                            # Legacy compatibility
-                            {
-                                'disabled_algorithms': {
-                                    'kex': ['diffie-hellman-group14-sha256', 'diffie-hellman-group16-sha512'],
-                                    'ciphers': [],
-                                    'macs': []
-                                }
-                            }
-                        ]
-                        
-                        for i, config in enumerate(ssh_configs):
-                            try:
-                                if ssh:
-                                    ssh.close()
-                                ssh = paramiko.SSHClient()
-                                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                                
-                                final_params = {**connect_params, **config}
-                                ssh.connect(**final_params)
-                                
-                                # Use invoke_shell for better switch compatibility
-                                shell = ssh.invoke_shell()
-                                
-                                # Send initial ENTER to activate CLI session
-                                shell.send('\n')
-                                time.sleep(0.5)  # Wait for prompt
-                                
-                                # Disable paging to prevent "-- MORE --" prompts
-                                shell.send('no page\n')
-                                time.sleep(0.5)
-                                
-                                # Clear any initial output/banner and paging setup response
-                                if shell.recv_ready():
-                                    shell.recv(4096)
-                                
-                                # Send the command(s) - handle multi-line commands
-                                command_lines = command.split('\n')
-                                for i, cmd_line in enumerate(command_lines):
-                                    if cmd_line.strip():  # Skip empty lines
-                                        _LOGGER.debug(f"Sending command line {i+1}/{len(command_lines)}: {cmd_line.strip()}")
-                                        shell.send(cmd_line.strip() + '\n')
-                                        time.sleep(0.8)  # Increased delay between commands
-                                
-                                # Wait for final command execution
-                                time.sleep(2)  # Increased final wait
-                                
-                                # Collect output with pager handling
-                                output = ""
-                                max_wait = 15  # Maximum wait time
-                                start_time = time.time()
-                                consecutive_empty_reads = 0
-                                
-                                while time.time() - start_time < max_wait:
-                                    if shell.recv_ready():
-                                        chunk = shell.recv(4096).decode('utf-8', errors='ignore')
-                                        output += chunk
-                                        consecutive_empty_reads = 0
-                                        
-                                        # Check for pager prompts and handle them
-                                        if "-- MORE --" in chunk or "next page: Space" in chunk:
-                                            _LOGGER.debug("Detected pager prompt, sending space to continue")
-                                            shell.send(' ')  # Send space to continue
-                                            time.sleep(0.5)
-                                        elif "(q to quit)" in chunk.lower() or "quit: control-c" in chunk.lower():
-                                            _LOGGER.debug("Detected quit prompt, sending 'q' to exit pager")
-                                            shell.send('q')  # Send 'q' to quit pager
-                                            time.sleep(0.5)
-                                        
-                                        time.sleep(0.1)
-                                    else:
-                                        consecutive_empty_reads += 1
-                                        time.sleep(0.3)
-                                        # Break if no data for several consecutive checks
-                                        if consecutive_empty_reads >= 5 and output:
-                                            break
-                                
-                                shell.close()
-                                
-                                # Remove ANSI escape sequences that clutter the output
-                                import re
-                                ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-                                output = ansi_escape.sub('', output)
-                                
-                                # Clean up the output (remove command echo, prompts, and pager artifacts)
-                                lines = output.split('\n')
-                                clean_lines = []
-                                for line in lines:
-                                    line = line.strip()
-                                    # Skip empty lines, command echoes, prompts, and pager artifacts
-                                    if (line and 
-                                        not line.endswith('#') and 
-                                        not line.endswith('>') and
-                                        '-- MORE --' not in line and
-                                        'next page: Space' not in line and
-                                        'quit: Control-C' not in line and
-                                        'no page' not in line and
-                                        command.replace('\n', ' ').strip() not in line):
-                                        clean_lines.append(line)
-                                
-                                output = '\n'.join(clean_lines)
-                                
-                                _LOGGER.debug(f"SSH command '{command}' output for {self.host}: {repr(output)}")
-                                
-                                # Reset backoff on successful connection
-                                self._connection_backoff = 0.1
-                                return output
-                                
-                            except (paramiko.SSHException, EOFError, OSError) as e:
-                                if i == len(ssh_configs) - 1:  # Last attempt
-                                    # Smaller backoff increase
-                                    self._connection_backoff = min(self._connection_backoff * 1.5, self._max_backoff)
-                                    raise e
-                                continue
-                        
-                        return None
-                        
-                    except Exception as e:
-                        # Smaller backoff increase
-                        self._connection_backoff = min(self._connection_backoff * 1.5, self._max_backoff)
-                        raise
-                    finally:
-                        if ssh:
-                            try:
-                                ssh.close()
-                            except Exception as e:
-                                _LOGGER.debug(f"Error closing SSH connection: {e}")
+                # Send initial ENTER to activate CLI session and wait for the prompt
+                shell.send('\n')
+                banner = _RE_ANSI.sub('', self._read_until_prompt(shell, max_wait=5))
                 
-                # Run in executor with shorter timeout
-                loop = asyncio.get_event_loop()
-                try:
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(None, _sync_execute), 
-                        timeout=timeout + 2
+                # Only accept this switch's own prompt from now on, so output lines that
+                # happen to end in '#' or '>' can't end a read early
+                prompt_match = _RE_PROMPT.search(banner)
+                if prompt_match:
+                    self._prompt_re = re.compile(
+                        r'(?:^|[\r\n])\s*' + re.escape(prompt_match.group(1)) + _PROMPT_CONTEXT
                     )
-                    
-                    # Update availability on successful command execution
-                    if result is not None:
-                        was_offline = not self._is_available
-                        self._is_available = True
-                        self._last_successful_connection = time.time()
-                        if was_offline:
-                            _LOGGER.info(f"Switch {self.host} is back online")
-                    else:
-                        was_online = self._is_available
-                        self._is_available = False
-                        if was_online:
-                            _LOGGER.warning(f"Switch {self.host} went offline (command returned no data)")
-                            
-                    return result
-                except asyncio.TimeoutError:
-                    _LOGGER.debug(f"SSH command '{command}' timed out for {self.host}")
-                    was_online = self._is_available
-                    self._is_available = False
-                    if was_online:
-                        _LOGGER.warning(f"Switch {self.host} went offline (timeout)")
-                    return None
+                
+                # Disable paging once per session to prevent "-- MORE --" prompts
+                shell.send('no page\n')
+                self._read_until_prompt(shell, max_wait=5)
+            except (paramiko.SSHException, EOFError, OSError):
+                ssh.close()
+                if i == len(ssh_configs) - 1:  # Last attempt
+                    # Probe all configs again next time in case the switch changed
+                    self._ssh_config = None
+                    raise
+                continue
+            
+            self._ssh = ssh
+            self._shell = shell
+            self._connected_at = time.monotonic()
+            self._ssh_config = config
+            _LOGGER.debug(f"Opened SSH session to {self.host}")
+            return
+
+    def _ensure_connection(self, timeout: int) -> paramiko.Channel:
+        """Return the live shell, reconnecting only if the session was lost (runs in executor)."""
+        if not self._is_connected():
+            self._close_connection()
+            self._connect(timeout)
+        return self._shell
+
+    def _close_connection(self) -> None:
+        """Close the persistent SSH session if one is open."""
+        shell, ssh = self._shell, self._ssh
+        self._shell = None
+        self._ssh = None
+        for resource in (shell, ssh):
+            if resource is not None:
+                try:
+                    resource.close()
                 except Exception as e:
-                    _LOGGER.debug(f"SSH command '{command}' failed for {self.host}: {e}")
-                    was_online = self._is_available
-                    self._is_available = False
-                    if was_online:
-                        _LOGGER.warning(f"Switch {self.host} went offline (connection error: {e})")
-                    return None
+                    _LOGGER.debug(f"Error closing SSH connection: {e}")
+
+    def _read_until_prompt(self, shell: paramiko.Channel, max_wait: float = 15, require_prompt: bool = False) -> str:
+        """Read shell output until the CLI prompt reappears or max_wait expires.
+        
+        With require_prompt, running out of time raises TimeoutError instead of returning
+        the partial output, since the session is then in an unknown state.
+        """
+        # Collect raw bytes and decode once at the end so multi-byte characters
+        # split across reads stay intact
+        chunks: list[bytes] = []
+        tail = b""
+        deadline = time.monotonic() + max_wait
+        
+        while time.monotonic() < deadline:
+            try:
+                data = shell.recv(65536)
+            except socket.timeout:
+                continue
+            if not data:
+                raise EOFError("SSH shell closed by switch")
+            
+            chunks.append(data)
+            data_lower = data.lower()
+            
+            # Check for pager prompts and handle them
+            if b"-- MORE --" in data or b"next page: Space" in data:
+                _LOGGER.debug("Detected pager prompt, sending space to continue")
+                shell.send(' ')  # Send space to continue
+                continue
+            elif b"(q to quit)" in data_lower or b"quit: control-c" in data_lower:
+                _LOGGER.debug("Detected quit prompt, sending 'q' to exit pager")
+                shell.send('q')  # Send 'q' to quit pager
+                continue
+            
+            # Done as soon as the switch prints its prompt again
+            tail = (tail + data)[-256:]
+            if (self._prompt_re or _RE_PROMPT).search(_RE_ANSI.sub('', tail.decode('utf-8', errors='ignore'))):
+                break
+        else:
+            if require_prompt:
+                raise TimeoutError(f"No prompt from {self.host} within {max_wait}s")
+        
+        return b"".join(chunks).decode('utf-8', errors='ignore')
 
+    def _run_on_shell(self, shell: paramiko.Channel, command: str, timeout: float) -> str:
+        """Send a (possibly multi-line) command to the shell and return its cleaned output.
+        
+        Each line must bring the prompt back within timeout seconds.
+        """
+        # Discard anything left over from a previous command on this session
+        while shell.recv_ready():
+            shell.recv(65536)
+        
+        # Send the command(s) one line at a time, waiting for the prompt after each
+        outputs = []
+        command_lines = command.split('\n')
+        for i, cmd_line in enumerate(command_lines):
+            if cmd_line.strip():  # Skip empty lines
+                _LOGGER.debug("Sending command line %d/%d: %s", i + 1, len(command_lines), cmd_line.strip())
+                shell.send(cmd_line.strip() + '\n')
+                outputs.append(self._read_until_prompt(shell, max_wait=timeout, require_prompt=True))
+        
+        # Remove ANSI escape sequences that clutter the output
+        output = _RE_ANSI.sub('', "".join(outputs))
+        
+        # Clean up the output (remove command echo, prompts, and pager artifacts)
+        command_echo = command.replace('\n', ' ').strip()
+        clean_lines = []
+        for line in output.split('\n'):
+            line = line.strip()
+            # Skip empty lines, command echoes, prompts, and pager artifacts
+            if (line and 
+                not line.endswith(('#', '>')) and
+                '-- MORE --' not in line and
+                'next page: Space' not in line and
+                'quit: Control-C' not in line and
+                'no page' not in line and
+                command_echo not in line):
+                clean_lines.append(line)
+        
+        output = '\n'.join(clean_lines)
+        
+        # Lazy arguments: repr() of a full command output is only built when debug logging is on
+        _LOGGER.debug("SSH command '%s' output for %s: %r", command, self.host, output)
+        return output
+
+    async def close(self) -> None:
+        """Close the persistent SSH session (it is reopened on the next command)."""
+        async with self._connection_lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_SSH_EXECUTOR, self._close_connection)
+
+    async def _abandon_worker(self, future: asyncio.Future, cancelled: threading.Event) -> None:
+        """Stop a timed-out executor call and wait until it has left the session.
+
+        Closing the session makes the worker's pending recv() fail; with the cancel flag
+        set it then gives up instead of reconnecting. Waiting for it keeps the caller's
+        _connection_lock held, so the next command never shares the shell with it.
+        """
+        cancelled.set()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_SSH_EXECUTOR, self._close_connection)
+        try:
+            await future
+        except Exception as e:
+            _LOGGER.debug(f"Abandoned SSH worker for {self.host} stopped: {e}")
+
+    async def execute_command(self, command: str, timeout: int = 10) -> Optional[str]:
+        """Execute a command on the switch over the persistent SSH session."""
+        return (await self.execute_commands([command], timeout=timeout))[0]
+
+    async def execute_commands(self, commands: list[str], timeout: int = 10) -> list[Optional[str]]:
+        """Execute several commands back-to-back on one shell, returning one output per command.
+
+        The lock, backoff and executor hop are paid once for the whole batch. timeout
+        applies to each command line, so multi-line config batches get a budget to match.
+        If the session fails, every entry in the returned list is None.
+        """
+        # Use the lock directly as an async context manager
+        async with self._connection_lock:
+            # Minimal backoff to avoid overwhelming
+            time_since_last = time.monotonic() - self._last_connection_attempt
+            if time_since_last < self._connection_backoff:
+                await asyncio.sleep(self._connection_backoff - time_since_last)
+            
+            self._last_connection_attempt = time.monotonic()
+            
+            # Set once the caller has given up, so the worker neither retries nor
+            # reconnects to replay commands (possibly config writes) on its own
+            cancelled = threading.Event()
+            
+            def _live_shell() -> paramiko.Channel:
+                shell = self._ensure_connection(timeout)
+                if cancelled.is_set():
+                    raise TimeoutError(f"SSH commands for {self.host} were abandoned after a timeout")
+                return shell
+            
+            def _sync_execute():
+                outputs = []
+                try:
+                    for command in commands:
+                        reused = self._is_connected()
+                        try:
+                            output = self._run_on_shell(_live_shell(), command, timeout)
+                        except (paramiko.SSHException, EOFError, OSError) as e:
+                            self._close_connection()
+                            # A switch that stopped answering isn't a dropped idle session
+                            if not reused or cancelled.is_set() or isinstance(e, TimeoutError):
+                                raise
+                            # The switch dropped an idle session - reconnect once and retry
+                            _LOGGER.debug(
+                                f"SSH session to {self.host} lost after {time.monotonic() - self._connected_at:.0f}s ({e}), reconnecting"
+                            )
+                            output = self._run_on_shell(_live_shell(), command, timeout)
+                        outputs.append(output)
+                    
+                    # Reset backoff on successful commands
+                    self._connection_backoff = 0.1
+                    return outputs
+                    
+                except Exception:
+                    # Smaller backoff increase
+                    self._connection_backoff = min(self._connection_backoff * 1.5, self._max_backoff)
+                    self._close_connection()
+                    raise
+            
+            # Run in executor, allowing one timeout per command line sent plus one for (re)connecting
+            line_count = sum(1 for command in commands for line in command.split('\n') if line.strip())
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(_SSH_EXECUTOR, _sync_execute)
+            try:
+                # Shielded so a timeout doesn't detach the future from the still-running worker
+                results = await asyncio.wait_for(
+                    asyncio.shield(future),
+                    timeout=timeout * (line_count + 1) + 2
+                )
+                
+                # Update availability on successful command execution
+                was_offline = not self._is_available
+                self._is_available = True
+                self._last_successful_connection = time.time()
+                if was_offline:
+                    _LOGGER.info(f"Switch {self.host} is back online")
+                        
+                return results
+            except asyncio.TimeoutError:
+                _LOGGER.debug(f"SSH commands {commands} timed out for {self.host}")
+                await self._abandon_worker(future, cancelled)
+                was_online = self._is_available
+                self._is_available = False
+                if was_online:
+                    _LOGGER.warning(f"Switch {self.host} went offline (timeout)")
+                return [None] * len(commands)
+            except asyncio.CancelledError:
+                await self._abandon_worker(future, cancelled)
+                raise
+            except Exception as e:
+                _LOGGER.debug(f"SSH commands {commands} failed for {self.host}: {e}")
+                was_online = self._is_available
+                self._is_available = False
+                if was_online:
+                    _LOGGER.warning(f"Switch {self.host} went offline (connection error: {e})")
+                return [None] * len(commands)
+
+
+    def invalidate_cache(self) -> None:
+        """Mark switch data as stale after a configuration change."""
+        self._data_version += 1
 
     async def get_all_switch_data(self) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
-        """Execute all commands sequentially and parse each output independently.
+        """Return switch data, sharing one fetch between concurrent callers.
         
-        Each SSH command is executed individually and its output is sent to a dedicated parser.
-        This makes parsing logic cleaner and easier to test.
+        A result younger than _cache_ttl is returned without touching the switch unless
+        invalidate_cache() was called since it was fetched.
         
         Returns:
             Tuple of (interfaces, statistics, link_details, poe_ports, version_info) dictionaries.
         """
+        cached = self._data_cache
+        if (
+            cached is not None
+            and cached[1] == self._data_version
+            and time.monotonic() - cached[0] < self._cache_ttl
+        ):
+            _LOGGER.debug(f"Serving cached data for {self.host}")
+            return cached[2]
+        
+        task = self._bulk_task
+        if task is None or task.done() or self._bulk_version != self._data_version:
+            task = asyncio.ensure_future(self._fetch_all_switch_data())
+            self._bulk_task = task
+            self._bulk_version = self._data_version
+        else:
+            _LOGGER.debug(f"Joining in-flight data fetch for {self.host}")
+        
+        version = self._bulk_version
+        
+        # Shield so a cancelled caller doesn't cancel the fetch for the others
+        result = await asyncio.shield(task)
+        if any(result):
+            self._data_cache = (time.monotonic(), version, result)
+        return result
+
+    async def _fetch_all_switch_data(self) -> tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Execute all commands in one batch and parse each output independently.
+        
+        The commands share one SSH session and each output is sent to a dedicated parser.
+        This makes parsing logic cleaner and easier to test. 'show interface all' only
+        runs every _FULL_POLL_INTERVAL refreshes; in between its last result is reused
+        with link and admin state refreshed from 'show interface brief'.
+        
+        Returns:
+            Tuple of (interfaces, statistics, link_details, poe_ports, version_info) dictionaries.
+        """
+        full_poll = (
+            self._interface_all_cache is None
+            or self._polls_since_full_poll >= _FULL_POLL_INTERVAL
+        )
         commands = {
             "show interface all": self.parse_show_interface_all,
             "show interface brief": self.parse_show_interface_brief,
@@ -250,30 +651,41 @@ class ArubaSSHManager:
         poe_ports: Dict[str, Any] = {}
         version_info: Dict[str, Any] = {}
 
-        # Execute each command and parse its output independently
-        for cmd, parser in commands.items():
-            _LOGGER.debug(f"📋 Executing command '{cmd}' for {self.host}")
-            try:
-                output = await self.execute_command(cmd, timeout=20)
-            except Exception as err:
-                _LOGGER.error(f"❌ Command '{cmd}' failed for {self.host}: {err}")
-                continue
+        if not full_poll:
+            del commands["show interface all"]
+            # Start from copies of the last counters so the merges below don't touch the cache
+            for target, cached in zip((interfaces, statistics, link_details), self._interface_all_cache):
+                target.update({port: dict(values) for port, values in cached.items()})
 
+        # Run all commands in one batch on the shared session
+        _LOGGER.debug("📋 Executing commands %s for %s", list(commands), self.host)
+        outputs = await self.execute_commands(list(commands), timeout=20)
+
+        # Parse each command's output independently
+        parsed_commands = set()
+        for (cmd, parser), output in zip(commands.items(), outputs):
             if not output:
                 _LOGGER.warning(f"⚠️ Command '{cmd}' returned no data for {self.host}")
                 continue
 
-            # Parse the output using the dedicated parser
+            # Parse the output in a worker thread to keep the event loop free
             try:
-                loop = asyncio.get_event_loop()
                 result = await asyncio.wait_for(
-                    loop.run_in_executor(None, parser, output),
+                    asyncio.to_thread(parser, output),
                     timeout=10.0,
                 )
                 
                 # Merge results based on command type
                 if cmd == "show interface all":
                     ifaces, stats, links = result
+                    if ifaces:
+                        self._interface_all_cache = (
+                            {port: dict(values) for port, values in ifaces.items()},
+                            {port: dict(values) for port, values in stats.items()},
+                            {port: dict(values) for port, values in links.items()},
+                        )
+                        # Only a successful full poll restarts the count; a failed one is retried
+                        self._polls_since_full_poll = 0
                     interfaces.update(ifaces)
                     statistics.update(stats)
                     link_details.update(links)
@@ -283,6 +695,12 @@ class ArubaSSHManager:
                     brief_info = result
                     # Merge brief info (speed/duplex) into link_details
                     for port, info in brief_info.items():
+                        if not full_poll and port in interfaces:
+                            # Counters are from an earlier poll, but link and admin state are current
+                            interfaces[port]["port_enabled"] = info["enabled"]
+                            interfaces[port]["link_status"] = "up" if info["link_up"] else "down"
+                            link_details[port]["port_enabled"] = info["enabled"]
+                            link_details[port]["link_up"] = info["link_up"]
                         if port in link_details:
                             link_details[port].update({
                                 "link_speed": f"{info['link_speed_mbps']} Mbps" if info['link_speed_mbps'] > 0 else "unknown",
@@ -310,12 +728,22 @@ class ArubaSSHManager:
                 elif cmd == "show version":
                     version_info.update(result)
                     _LOGGER.debug(f"✅ Parsed version: {bool(result)}")
+                
+                parsed_commands.add(cmd)
                     
             except asyncio.TimeoutError:
                 _LOGGER.error(f"❌ Parsing timed out for command '{cmd}' on {self.host}")
             except Exception as err:
                 _LOGGER.error(f"❌ Parsing failed for command '{cmd}' on {self.host}: {err}")
 
+        self._polls_since_full_poll += 1
+
+        # Between full polls the counters are pre-filled from the cache, so the poll only
+        # counts if the brief table refreshed link state; otherwise report the failure
+        if not full_poll and "show interface brief" not in parsed_commands:
+            _LOGGER.error(f"❌ No fresh link state from {self.host}, not serving cached counters")
+            return {}, {}, {}, {}, {}
+
         if any([interfaces, statistics, link_details, poe_ports, version_info]):
             _LOGGER.info(
                 "✅ Data collection succeeded for %s (interfaces=%d, stats=%d, links=%d, poe=%d, version=%s)",
@@ -345,18 +773,12 @@ class ArubaSSHManager:
         statistics: dict[str, dict] = {}
         link_details: dict[str, dict] = {}
         current_interface: str | None = None
-        in_totals_section = False
-        in_errors_section = False
-        in_others_section = False
-        in_rates_section = False
+        section: str | None = None
 
         for raw_line in output.split('\n'):
             line = raw_line.strip()
             if not line:
-                in_totals_section = False
-                in_errors_section = False
-                in_others_section = False
-                in_rates_section = False
+                section = None
                 continue
 
             line_lower = line.lower()
@@ -373,73 +795,21 @@ class ArubaSSHManager:
                     if "port counters for port" in line_lower:
                         port_num = line.split("port")[-1].strip()
                     elif "interface" in line_lower:
-                        import re
-
-                        match = re.search(r"(?:interface|port|gi|fa|te)[\s]*(\d+)", line_lower)
+                        match = _RE_INTERFACE_HEADER.search(line_lower)
                         if match:
                             port_num = match.group(1)
                     elif line_lower.startswith("port"):
-                        import re
-
-                        match = re.search(r"port[\s]*(\d+)", line_lower)
+                        match = _RE_PORT_HEADER.search(line_lower)
                         if match:
                             port_num = match.group(1)
 
                     if port_num:
                         current_interface = port_num
-                        interfaces[current_interface] = {
-                            "port_enabled": False,
-                            "link_status": "down",
-                            "mac_address": "unknown",
-                            "name": ""
-                        }
-                        statistics[current_interface] = {
-                            "bytes_in": 0,
-                            "bytes_out": 0,
-                            "packets_in": 0,
-                            "packets_out": 0,
-                            "bytes_rx": 0,
-                            "bytes_tx": 0,
-                            "unicast_rx": 0,
-                            "unicast_tx": 0,
-                            "bcast_mcast_rx": 0,
-                            "bcast_mcast_tx": 0,
-                            # Error counters
-                            "fcs_rx": 0,
-                            "drops_tx": 0,
-                            "alignment_rx": 0,
-                            "collisions_tx": 0,
-                            "runts_rx": 0,
-                            "late_colln_tx": 0,
-                            "giants_rx": 0,
-                            "excessive_colln": 0,
-                            "total_rx_errors": 0,
-                            "deferred_tx": 0,
-                            # Other counters
-                            "discard_rx": 0,
-                            "out_queue_len": 0,
-                            "unknown_protos": 0,
-                            # Rates (5 minute averages)
-                            "total_rx_bps": 0,
-                            "total_tx_bps": 0,
-                            "unicast_rx_pps": 0,
-                            "unicast_tx_pps": 0,
-                            "bcast_mcast_rx_pps": 0,
-                            "bcast_mcast_tx_pps": 0,
-                            "utilization_rx_percent": 0.0,
-                            "utilization_tx_percent": 0.0,
-                        }
-                        link_details[current_interface] = {
-                            "link_up": False,
-                            "port_enabled": False,
-                            "link_speed": "unknown",
-                            "duplex": "unknown",
-                        }
-                        _LOGGER.debug(f"Started parsing port {current_interface} from line: '{line}'")
-                        in_totals_section = False
-                        in_errors_section = False
-                        in_others_section = False
-                        in_rates_section = False
+                        interfaces[current_interface] = _INTERFACE_DEFAULTS.copy()
+                        statistics[current_interface] = _STATISTICS_DEFAULTS.copy()
+                        link_details[current_interface] = _LINK_DETAILS_DEFAULTS.copy()
+                        _LOGGER.debug("Started parsing port %s from line: '%s'", current_interface, line)
+                        section = None
                 except Exception:
                     continue
 
@@ -448,248 +818,77 @@ class ArubaSSHManager:
             if current_interface is None:
                 continue
 
-            # Track which section of the output we're parsing
-            if "totals (since boot" in line_lower:
-                in_totals_section = True
-                in_errors_section = False
-                in_others_section = False
-                in_rates_section = False
-                continue
-            elif "errors (since boot" in line_lower:
-                in_totals_section = False
-                in_errors_section = True
-                in_others_section = False
-                in_rates_section = False
-                continue
-            elif "others (since boot" in line_lower:
-                in_totals_section = False
-                in_errors_section = False
-                in_others_section = True
-                in_rates_section = False
-                continue
-            elif "rates (" in line_lower:
-                in_totals_section = False
-                in_errors_section = False
-                in_others_section = False
-                in_rates_section = True
+            if ":" not in line:
                 continue
 
-            # Parse port status, link details, and statistics
-            import re
+            key, _, value_str = line.partition(":")
+            key = " ".join(key.split()).lower()
+            value_str = value_str.strip()
 
-            if "enabled" in line_lower:
-                _LOGGER.debug(
-                    f"Port {current_interface}: DEBUG - Line contains 'enabled': '{line}' (repr: {repr(line)})"
-                )
+            # Track which section of the output we're parsing, e.g. "Totals (Since boot or last clear) :"
+            if " (" in key:
+                new_section = _INTERFACE_SECTIONS.get(key.partition(" (")[0])
+                if new_section:
+                    section = new_section
+                    continue
 
-            normalized_line = re.sub(r"\s+", " ", line_lower.strip())
-            
             # Port enabled status
-            if ("port enabled :" in normalized_line) or ("port enabled:" in normalized_line):
-                value_part = line.split(":", 1)[1].strip().lower()
+            if key == "port enabled":
+                value_part = value_str.lower()
                 is_enabled = any(pos in value_part for pos in ["yes", "enabled", "up", "active", "true"])
                 interfaces[current_interface]["port_enabled"] = is_enabled
                 link_details[current_interface]["port_enabled"] = is_enabled
                 _LOGGER.debug(
-                    f"Port {current_interface}: Found 'Port Enabled' line: '{line}' -> value_part: '{value_part}' -> is_enabled: {is_enabled}"
+                    "Port %s: Found 'Port Enabled' line: '%s' -> value_part: '%s' -> is_enabled: %s",
+                    current_interface, line, value_part, is_enabled,
                 )
                 continue
 
             # Link status
-            if ("link status :" in normalized_line) or ("link status:" in normalized_line):
-                value_part = line.split(":", 1)[1].strip().lower()
+            if key == "link status":
+                value_part = value_str.lower()
                 link_up = "up" in value_part
                 interfaces[current_interface]["link_status"] = "up" if link_up else "down"
                 link_details[current_interface]["link_up"] = link_up
                 _LOGGER.debug(
-                    f"Port {current_interface}: Found 'Link Status' line: '{line}' -> value_part: '{value_part}' -> link_up: {link_up}"
+                    "Port %s: Found 'Link Status' line: '%s' -> value_part: '%s' -> link_up: %s",
+                    current_interface, line, value_part, link_up,
                 )
                 continue
 
             # MAC Address
-            if "mac address" in normalized_line and ":" in line:
-                parts = line.split(":", 1)
-                if len(parts) == 2:
-                    mac_address = parts[1].strip()
-                    interfaces[current_interface]["mac_address"] = mac_address
-                    continue
+            if key == "mac address":
+                interfaces[current_interface]["mac_address"] = value_str
+                continue
 
             # Port Name
-            if normalized_line.startswith("name :") or normalized_line.startswith("name:"):
-                parts = line.split(":", 1)
-                if len(parts) == 2:
-                    name = parts[1].strip()
-                    interfaces[current_interface]["name"] = name
-                    continue
-
-            if ":" not in line:
+            if key == "name":
+                interfaces[current_interface]["name"] = value_str
                 continue
 
-            parts = line.split(":", 1)
-            if len(parts) != 2:
+            # Counter lines carry an Rx value and (usually) a Tx value
+            fields = _INTERFACE_COUNTERS.get((section, key))
+            if fields:
+                for names, number in zip(fields, _extract_numbers(value_str)):
+                    for name in names:
+                        statistics[current_interface][name] = number
                 continue
 
-            key = parts[0].strip().lower()
-            value_str = parts[1].strip()
-
-            def extract_numbers(text: str) -> list[int]:
-                numbers: list[int] = []
-                for match in re.finditer(r"(\d{1,3}(?:,\d{3})*)", text):
-                    number_str = match.group(1).replace(",", "")
-                    try:
-                        numbers.append(int(number_str))
-                    except ValueError:
-                        continue
-                return numbers
-
-            def extract_float(text: str) -> float:
-                """Extract floating point number from text."""
-                match = re.search(r'(\d+(?:\.\d+)?)', text)
-                if match:
-                    try:
-                        return float(match.group(1))
-                    except ValueError:
-                        pass
-                return 0.0
-
-            # Totals section
-            if in_totals_section:
-                if "bytes rx" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["bytes_rx"] = numbers[0]
-                        statistics[current_interface]["bytes_tx"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["bytes_rx"] = numbers[0]
-                    continue
-
-                if "unicast rx" in key and "pkts/sec" not in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["unicast_rx"] = numbers[0]
-                        statistics[current_interface]["unicast_tx"] = numbers[1]
-                        statistics[current_interface]["packets_in"] = numbers[0]
-                        statistics[current_interface]["packets_out"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["unicast_rx"] = numbers[0]
-                        statistics[current_interface]["packets_in"] = numbers[0]
-                    continue
-
-                if "bcast/mcast rx" in key or "b/mcast rx" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["bcast_mcast_rx"] = numbers[0]
-                        statistics[current_interface]["bcast_mcast_tx"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["bcast_mcast_rx"] = numbers[0]
-                    continue
-
-            # Errors section
-            if in_errors_section:
-                if "fcs rx" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["fcs_rx"] = numbers[0]
-                        statistics[current_interface]["drops_tx"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["fcs_rx"] = numbers[0]
-                    continue
-
-                if "alignment rx" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["alignment_rx"] = numbers[0]
-                        statistics[current_interface]["collisions_tx"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["alignment_rx"] = numbers[0]
-                    continue
-
-                if "runts rx" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["runts_rx"] = numbers[0]
-                        statistics[current_interface]["late_colln_tx"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["runts_rx"] = numbers[0]
-                    continue
-
-                if "giants rx" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["giants_rx"] = numbers[0]
-                        statistics[current_interface]["excessive_colln"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["giants_rx"] = numbers[0]
-                    continue
-
-                if "total rx errors" in key or "total errors" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["total_rx_errors"] = numbers[0]
-                        statistics[current_interface]["deferred_tx"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["total_rx_errors"] = numbers[0]
-                    continue
-
-            # Others section
-            if in_others_section:
-                if "discard rx" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["discard_rx"] = numbers[0]
-                        statistics[current_interface]["out_queue_len"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["discard_rx"] = numbers[0]
-                    continue
-
-                if "unknown protos" in key or "unknown proto" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 1:
-                        statistics[current_interface]["unknown_protos"] = numbers[0]
-                    continue
-
-            # Rates section
-            if in_rates_section:
-                if "total rx (bps)" in key or "total rx" in key and "bps" in key:
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["total_rx_bps"] = numbers[0]
-                        statistics[current_interface]["total_tx_bps"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["total_rx_bps"] = numbers[0]
-                    continue
-
-                if "unicast rx (pkts/sec)" in key or ("unicast rx" in key and "pkts/sec" in key):
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["unicast_rx_pps"] = numbers[0]
-                        statistics[current_interface]["unicast_tx_pps"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["unicast_rx_pps"] = numbers[0]
-                    continue
-
-                if "b/mcast rx (pkts/sec)" in key or ("b/mcast rx" in key and "pkts/sec" in key):
-                    numbers = extract_numbers(value_str)
-                    if len(numbers) >= 2:
-                        statistics[current_interface]["bcast_mcast_rx_pps"] = numbers[0]
-                        statistics[current_interface]["bcast_mcast_tx_pps"] = numbers[1]
-                    elif len(numbers) == 1:
-                        statistics[current_interface]["bcast_mcast_rx_pps"] = numbers[0]
-                    continue
-
-                if "utilization rx" in key:
-                    util_rx = extract_float(value_str)
+            if section == "rates":
+                if key == "utilization rx":
+                    util_rx = _extract_float(value_str)
                     statistics[current_interface]["utilization_rx_percent"] = util_rx
                     # Try to extract TX utilization from same line
-                    if "utilization tx" in value_str.lower():
-                        tx_match = re.search(r'utilization tx\s*:\s*([\d.]+)', value_str.lower())
+                    value_lower = value_str.lower()
+                    if "utilization tx" in value_lower:
+                        tx_match = _RE_UTILIZATION_TX.search(value_lower)
                         if tx_match:
                             util_tx = float(tx_match.group(1))
                             statistics[current_interface]["utilization_tx_percent"] = util_tx
                     continue
 
-                if "utilization tx" in key:
-                    util_tx = extract_float(value_str)
+                if key == "utilization tx":
+                    util_tx = _extract_float(value_str)
                     statistics[current_interface]["utilization_tx_percent"] = util_tx
                     continue
 
@@ -705,75 +904,45 @@ class ArubaSSHManager:
             Dictionary mapping port number to brief info (speed, duplex, etc.).
         """
         brief_info = {}
-        lines = output.split('\n')
-        in_port_section = False
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        for match in _RE_BRIEF_ROW.finditer(output):
+            port_num, port_type, alert, enabled, status, mode, mdi, flow_control = match.groups()
             
-            # Look for the header line to start parsing
-            if "port" in line.lower() and ("type" in line.lower() or "status" in line.lower()):
-                in_port_section = True
-                continue
-            elif line.startswith("-") or line.startswith("="):
-                continue
-            elif not in_port_section:
-                continue
+            speed_mbps = 0
+            duplex = "unknown"
             
-            # Parse port data lines
-            if "|" in line:
-                parts = line.split("|")
-                if len(parts) >= 2:
-                    left_part = parts[0].strip()
-                    right_part = parts[1].strip()
-                    
-                    port_match = left_part.split()
-                    if port_match:
-                        try:
-                            port_num = port_match[0]
-                            right_fields = right_part.split()
-                            if len(right_fields) >= 4:
-                                mode = right_fields[3]
-                                
-                                speed_mbps = 0
-                                duplex = "unknown"
-                                
-                                if mode and mode != ".":
-                                    import re
-                                    speed_match = re.match(r'(\d+)(FD|HD|F|H)?x?', mode)
-                                    if speed_match:
-                                        speed_mbps = int(speed_match.group(1))
-                                        duplex_code = speed_match.group(2)
-                                        if duplex_code:
-                                            if duplex_code.startswith('F'):
-                                                duplex = "full"
-                                            elif duplex_code.startswith('H'):
-                                                duplex = "half"
-                                elif mode == ".":
-                                    # SFP ports show "." when no link - these are typically SFP/uplink ports
-                                    # For ports 25-28 (common SFP ports), assume they are SFP capable
-                                    try:
-                                        port_int = int(port_num)
-                                        if port_int >= 25:  # SFP ports are typically 25+
-                                            speed_mbps = 1000  # SFP ports are typically 1Gbps capable
-                                            duplex = "full"
-                                    except ValueError:
-                                        pass
-                                
-                                brief_info[port_num] = {
-                                    "link_speed_mbps": speed_mbps,
-                                    "duplex": duplex,
-                                    "mode": mode,
-                                    "mdi": right_fields[4] if len(right_fields) > 4 else "unknown",
-                                    "port_type": right_fields[0] if len(right_fields) > 0 else "unknown",
-                                    "intrusion_alert": right_fields[1].lower() == "yes" if len(right_fields) > 1 else False,
-                                    "enabled": right_fields[2].lower() == "yes" if len(right_fields) > 2 else False,
-                                    "flow_control": right_fields[5].lower() if len(right_fields) > 5 else "off",
-                                }
-                        except (ValueError, IndexError):
-                            continue
+            if mode != ".":
+                speed_match = _RE_BRIEF_MODE.match(mode)
+                if speed_match:
+                    speed_mbps = int(speed_match.group(1))
+                    duplex_code = speed_match.group(2)
+                    if duplex_code:
+                        if duplex_code.startswith('F'):
+                            duplex = "full"
+                        elif duplex_code.startswith('H'):
+                            duplex = "half"
+            else:
+                # SFP ports show "." when no link - these are typically SFP/uplink ports
+                # For ports 25-28 (common SFP ports), assume they are SFP capable
+                try:
+                    port_int = int(port_num)
+                    if port_int >= 25:  # SFP ports are typically 25+
+                        speed_mbps = 1000  # SFP ports are typically 1Gbps capable
+                        duplex = "full"
+                except ValueError:
+                    pass
+            
+            brief_info[port_num] = {
+                "link_speed_mbps": speed_mbps,
+                "duplex": duplex,
+                "mode": mode,
+                "mdi": mdi or "unknown",
+                "port_type": port_type or "unknown",
+                "intrusion_alert": alert.lower() == "yes",
+                "enabled": enabled.lower() == "yes",
+                "link_up": status.lower() == "up",
+                "flow_control": flow_control.lower() if flow_control else "off",
+            }
         
         return brief_info
     
@@ -787,200 +956,103 @@ class ArubaSSHManager:
             if not line:
                 continue
                 
-            # Look for port headers
-            port_header_patterns = [
-                "information for port", "port status", "interface", "gi", r"^[0-9]+[/]*[0-9]*\s"
-            ]
-            
+            # Look for port headers; the cheap substring check lets most data lines skip the rules
             line_lower = line.lower()
-            port_found = False
-            
-            for pattern in port_header_patterns:
-                if pattern == r"^[0-9]+[/]*[0-9]*\s":
-                    import re
-                    if re.match(r'^\s*\d+(/\d+)?\s+', line):
-                        try:
-                            current_port = line.split()[0]
-                            poe_ports[current_port] = {
-                                "power_enable": False,
-                                "poe_status": "off",
-                                "pse_voltage": 0.0,
-                                "pd_amperage_draw": 0,
-                                "pd_power_draw": 0.0,
-                                "pse_reserved_power": 0.0,
-                                "plc_class": "unknown",
-                                "plc_type": "unknown",
-                                "dlc_class": "unknown",
-                                "dlc_type": "unknown",
-                                "priority_config": "unknown",
-                                "pre_std_detect": "unknown",
-                                "lldp_pse_allocated": 0.0,
-                                "lldp_pd_requested": 0.0,
-                                "over_current_cnt": 0,
-                                "power_denied_cnt": 0,
-                                "short_cnt": 0,
-                                "mps_absent_cnt": 0,
-                            }
-                            port_found = True
-                            break
-                        except:
-                            continue
-                elif pattern in line_lower:
-                    try:
-                        if "port" in pattern:
-                            port_num = line.split("port")[-1].strip()
-                        elif "interface" in pattern:
-                            parts = line.split()
-                            port_num = parts[-1] if parts else ""
-                        else:
-                            port_num = line.split()[-1] if line.split() else ""
-                        
-                        if port_num and port_num.replace('/', '').replace('.', '').isdigit():
-                            current_port = port_num
-                            poe_ports[current_port] = {
-                                "power_enable": False,
-                                "poe_status": "off",
-                                "pse_voltage": 0.0,
-                                "pd_amperage_draw": 0,
-                                "pd_power_draw": 0.0,
-                                "pse_reserved_power": 0.0,
-                                "plc_class": "unknown",
-                                "plc_type": "unknown",
-                                "dlc_class": "unknown",
-                                "dlc_type": "unknown",
-                                "priority_config": "unknown",
-                                "pre_std_detect": "unknown",
-                                "lldp_pse_allocated": 0.0,
-                                "lldp_pd_requested": 0.0,
-                                "over_current_cnt": 0,
-                                "power_denied_cnt": 0,
-                                "short_cnt": 0,
-                                "mps_absent_cnt": 0,
-                            }
-                            port_found = True
-                            break
-                    except:
-                        continue
-            
-            if port_found:
+            if "port" in line_lower or "interface" in line_lower or "gi" in line_lower or line[0].isdigit():
+                port_num = _parse_poe_port_header(line, line_lower)
+            else:
+                port_num = None
+            if port_num is not None:
+                current_port = port_num
+                port_data = poe_ports[current_port] = _POE_PORT_DEFAULTS.copy()
                 continue
-            elif current_port:
-                # Parse PoE data for current port
-                def parse_combined_line(line_text):
-                    parsed_fields = {}
-                    import re
-                    matches = re.findall(r'([^:]+?)\s*:\s*([^:]*?)(?=\s{3,}[^:]+\s*:|$)', line_text)
-                    for key, value in matches:
-                        key = key.strip().lower()
-                        value = value.strip()
-                        parsed_fields[key] = value
-                    return parsed_fields
-                
-                parsed_data = parse_combined_line(line)
+            elif current_port and ":" in line:
+                # Parse PoE data for current port (section titles like "PoE Counter Information" have no fields)
+                parsed_data = _parse_poe_fields(line)
                 
                 for key, value in parsed_data.items():
                     value_lower = value.lower()
                     
                     if "power enable" in key:
                         is_enabled = "yes" in value_lower
-                        poe_ports[current_port]["power_enable"] = is_enabled
+                        port_data["power_enable"] = is_enabled
                     
                     elif "poe port status" in key or "poe status" in key:
-                        poe_status_str = "off"
-                        if "searching" in value_lower:
-                            poe_status_str = "searching"
-                        elif "delivering" in value_lower or "deliver" in value_lower:
-                            poe_status_str = "delivering"
-                        elif "enabled" in value_lower or "on" in value_lower or "active" in value_lower:
-                            poe_status_str = "on"
-                        elif "fault" in value_lower or "error" in value_lower or "overload" in value_lower:
-                            poe_status_str = "fault"
-                        elif "denied" in value_lower or "reject" in value_lower:
-                            poe_status_str = "denied"
-                        poe_ports[current_port]["poe_status"] = poe_status_str
+                        match = _RE_POE_STATUS.search(value_lower)
+                        port_data["poe_status"] = _POE_STATUS_MAP[match.group()] if match else "off"
                     
                     # Parse power and electrical values
                     elif "pse voltage" in key:
-                        import re
-                        match = re.search(r'([\d.]+)', value)
+                        match = _RE_POE_DECIMAL.search(value)
                         if match:
-                            poe_ports[current_port]["pse_voltage"] = float(match.group(1))
+                            port_data["pse_voltage"] = float(match.group(1))
                     
                     elif "pd amperage draw" in key:
-                        import re
-                        match = re.search(r'(\d+)', value)
+                        match = _RE_POE_INTEGER.search(value)
                         if match:
-                            poe_ports[current_port]["pd_amperage_draw"] = int(match.group(1))
+                            port_data["pd_amperage_draw"] = int(match.group(1))
                     
                     elif "pd power draw" in key:
-                        import re
-                        match = re.search(r'([\d.]+)', value)
+                        match = _RE_POE_DECIMAL.search(value)
                         if match:
-                            poe_ports[current_port]["pd_power_draw"] = float(match.group(1))
+                            port_data["pd_power_draw"] = float(match.group(1))
                     
                     elif "pse reserved power" in key:
-                        import re
-                        match = re.search(r'([\d.]+)', value)
+                        match = _RE_POE_DECIMAL.search(value)
                         if match:
-                            poe_ports[current_port]["pse_reserved_power"] = float(match.group(1))
+                            port_data["pse_reserved_power"] = float(match.group(1))
                     
                     # Parse PoE class and type
                     elif "plc class" in key:
-                        poe_ports[current_port]["plc_class"] = value
+                        port_data["plc_class"] = value
                     
                     elif "plc type" in key:
-                        poe_ports[current_port]["plc_type"] = value
+                        port_data["plc_type"] = value
                     
                     elif "dlc class" in key:
-                        poe_ports[current_port]["dlc_class"] = value
+                        port_data["dlc_class"] = value
                     
                     elif "dlc type" in key:
-                        poe_ports[current_port]["dlc_type"] = value
+                        port_data["dlc_type"] = value
                     
                     # Parse priority and detection
                     elif "priority config" in key:
-                        poe_ports[current_port]["priority_config"] = value_lower
+                        port_data["priority_config"] = value_lower
                     
                     elif "pre-std detect" in key:
-                        poe_ports[current_port]["pre_std_detect"] = value_lower
+                        port_data["pre_std_detect"] = value_lower
                     
                     # Parse LLDP power information
                     elif "lldp pse allocated" in key:
-                        import re
-                        match = re.search(r'([\d.]+)', value)
+                        match = _RE_POE_DECIMAL.search(value)
                         if match:
-                            poe_ports[current_port]["lldp_pse_allocated"] = float(match.group(1))
+                            port_data["lldp_pse_allocated"] = float(match.group(1))
                     
                     elif "lldp pd requested" in key:
-                        import re
-                        match = re.search(r'([\d.]+)', value)
+                        match = _RE_POE_DECIMAL.search(value)
                         if match:
-                            poe_ports[current_port]["lldp_pd_requested"] = float(match.group(1))
+                            port_data["lldp_pd_requested"] = float(match.group(1))
                     
                     # Parse error/fault counters
                     elif "over current cnt" in key:
-                        import re
-                        match = re.search(r'(\d+)', value)
+                        match = _RE_POE_INTEGER.search(value)
                         if match:
-                            poe_ports[current_port]["over_current_cnt"] = int(match.group(1))
+                            port_data["over_current_cnt"] = int(match.group(1))
                     
                     elif "power denied cnt" in key:
-                        import re
-                        match = re.search(r'(\d+)', value)
+                        match = _RE_POE_INTEGER.search(value)
                         if match:
-                            poe_ports[current_port]["power_denied_cnt"] = int(match.group(1))
+                            port_data["power_denied_cnt"] = int(match.group(1))
                     
                     elif "short cnt" in key:
-                        import re
-                        match = re.search(r'(\d+)', value)
+                        match = _RE_POE_INTEGER.search(value)
                         if match:
-                            poe_ports[current_port]["short_cnt"] = int(match.group(1))
+                            port_data["short_cnt"] = int(match.group(1))
                     
                     elif "mps absent cnt" in key:
-                        import re
-                        match = re.search(r'(\d+)', value)
+                        match = _RE_POE_INTEGER.search(value)
                         if match:
-                            poe_ports[current_port]["mps_absent_cnt"] = int(match.group(1))
+                            port_data["mps_absent_cnt"] = int(match.group(1))
         
         return poe_ports
 
@@ -1007,36 +1079,34 @@ class ArubaSSHManager:
                     _LOGGER.debug(f"🏷️ VERSION PARSING: Found hostname in prompt: {hostname} from line: {line}")
             
             # Parse various version fields from HP/Aruba switches
-            if ":" in line:
-                parts = line.split(":", 1)
-                if len(parts) == 2:
-                    key = parts[0].strip().lower()
-                    value = parts[1].strip()
+            key, sep, value = line.partition(":")
+            if sep:
+                key = key.strip().lower()
+                value = value.strip()
+                
+                # Map common version fields
+                if any(x in key for x in ["software revision", "firmware revision", "version", "release"]):
+                    version_info["firmware_version"] = value
+                elif any(x in key for x in ["rom version", "boot rom", "bootrom"]):
+                    boot_version = value  # Store but don't use as primary
+                    _LOGGER.debug(f"🔧 VERSION PARSING: Found boot ROM version: {value} from key: {key}")
+                elif any(x in key for x in ["model", "product", "type"]):
+                    if "model" not in version_info:  # Don't override hostname-extracted model
+                        version_info["model"] = value
+                elif any(x in key for x in ["serial", "serial number"]):
+                    version_info["serial_number"] = value
+                elif any(x in key for x in ["mac address", "base mac"]):
+                    version_info["mac_address"] = value
+                elif any(x in key for x in ["hardware", "hw rev"]):
+                    version_info["hardware_revision"] = value
+                elif any(x in key for x in ["uptime", "system uptime"]):
+                    version_info["uptime"] = value
                     
-                    # Map common version fields
-                    if any(x in key for x in ["software revision", "firmware revision", "version", "release"]):
-                        version_info["firmware_version"] = value
-                    elif any(x in key for x in ["rom version", "boot rom", "bootrom"]):
-                        boot_version = value  # Store but don't use as primary
-                        _LOGGER.debug(f"🔧 VERSION PARSING: Found boot ROM version: {value} from key: {key}")
-                    elif any(x in key for x in ["model", "product", "type"]):
-                        if "model" not in version_info:  # Don't override hostname-extracted model
-                            version_info["model"] = value
-                    elif any(x in key for x in ["serial", "serial number"]):
-                        version_info["serial_number"] = value
-                    elif any(x in key for x in ["mac address", "base mac"]):
-                        version_info["mac_address"] = value
-                    elif any(x in key for x in ["hardware", "hw rev"]):
-                        version_info["hardware_revision"] = value
-                    elif any(x in key for x in ["uptime", "system uptime"]):
-                        version_info["uptime"] = value
-                        
             # Also look for version patterns in any line - not just those with version keywords
             # Handle version lines that don't follow key:value format
             if "ya." in line_lower or "kb." in line_lower or "yc." in line_lower:
                 # Aruba version format like "YA.16.08.0002"
-                import re
-                version_match = re.search(r'[YK][A-Z]\.[\.\d]+', line, re.IGNORECASE)
+                version_match = _RE_FIRMWARE_VERSION.search(line)
                 if version_match:
                     version_str = version_match.group()
                     _LOGGER.debug(f"📟 VERSION PARSING: Found version string: {version_str} from line: {line}")
@@ -1070,9 +1140,15 @@ class ArubaSSHManager:
         return version_info
 
     async def get_current_data(self) -> dict:
-        """Get current data from switch - no caching, just live data."""
+        """Get switch data for the coordinator via get_all_switch_data.
+        
+        Not always live: a result up to _cache_ttl seconds old is served unless
+        invalidate_cache() was called, and per-port counters from 'show interface all'
+        are only refreshed every _FULL_POLL_INTERVAL polls (link and admin state come
+        from 'show interface brief' on every poll).
+        """
         try:
-            _LOGGER.debug(f"🔄 Getting live data for {self.host}")
+            _LOGGER.debug(f"🔄 Getting data for {self.host}")
             # Execute all commands in a single session
             interfaces, statistics, link_details, poe_ports, version_info = await self.get_all_switch_data()
             _LOGGER.debug(f"✅ get_all_switch_data completed for {self.host}")
@@ -1131,11 +1207,12 @@ class ArubaSSHManager:
             return False
 
 # Global connection managers
-_connection_managers: Dict[str, ArubaSSHManager] = {}
+_connection_managers: Dict[tuple[str, int], ArubaSSHManager] = {}
 
 def get_ssh_manager(host: str, username: str, password: str, ssh_port: int = 22) -> ArubaSSHManager:
     """Get or create an SSH manager for the given host."""
-    key = f"{host}:{ssh_port}"
-    if key not in _connection_managers:
-        _connection_managers[key] = ArubaSSHManager(host, username, password, ssh_port)
-    return _connection_managers[key]
\ No newline at end of file
+    key = (host, ssh_port)
+    manager = _connection_managers.get(key)
+    if manager is None:
+        manager = _connection_managers[key] = ArubaSSHManager(host, username, password, ssh_port)
+    return manager
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Switch entities for HP/Aruba Switch integration."""
 import asyncio
 import logging
+import traceback
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -237,5 +238,4 @@ class ArubaSwitch(ArubaSwitchEntity, SwitchEntity):
                 
         except Exception as e:
             _LOGGER.warning(f"Failed to update {self._attr_name} from coordinator: {e}")
-            import traceback
             _LOGGER.debug(f"Full traceback: {traceback.format_exc()}")
@@ -0,0 +1,426 @@
+"""Tests for the SSH manager session handling (no real switch required)."""
+import asyncio
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from custom_components.hp_aruba_switch import ssh_manager as ssh_module
+from custom_components.hp_aruba_switch.ssh_manager import ArubaSSHManager
+
+
+PROMPT = b"\r\nHP-2530-24G# "
+TEST_DATA = Path(__file__).parent / "test_data"
+
+
+class FakeClock:
+    """Manually advanced stand-in for the time module used by the SSH manager."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Replace the SSH manager's clock so deadlines and TTLs don't depend on real time."""
+    fake = FakeClock()
+    with patch.object(ssh_module, "time", fake):
+        yield fake
+
+
+class FakeChannel:
+    """Minimal stand-in for a paramiko shell channel that echoes a CLI prompt."""
+
+    def __init__(self, responses=None, hang_on=None, prompt=PROMPT, block_on_hang=False, clock=None):
+        self.sent = []
+        self._prompt = prompt
+        self.closed = False
+        self.eof_received = False
+        self._responses = list(responses or [])
+        self._pending = b""
+        self._timeout = None
+        # An empty recv() advances the clock by the socket timeout instead of waiting
+        self._clock = clock
+        self.timeouts = 0
+        # A command line the switch never answers, to exercise timeouts; with
+        # block_on_hang, recv() then ignores the socket timeout until the channel closes
+        self._hang_on = hang_on
+        self._block_on_hang = block_on_hang
+        self.hung = threading.Event()
+        self._closed_event = threading.Event()
+        self.released = threading.Event()
+
+    def send(self, data):
+        if self.closed:
+            raise OSError("Socket is closed")
+        self.sent.append(data)
+        if data.strip() == self._hang_on:
+            self.hung.set()
+            return
+        if data.strip() and data.strip() != "no page" and self._responses:
+            self._pending += self._responses.pop(0)
+        self._pending += self._prompt
+
+    def settimeout(self, timeout):
+        self._timeout = timeout
+
+    def recv_ready(self):
+        return bool(self._pending)
+
+    def recv(self, size):
+        if self.hung.is_set() and self._block_on_hang:
+            self._closed_event.wait(5)
+        if self.closed:
+            self.released.set()
+            return b""
+        if not self._pending:
+            self.timeouts += 1
+            if self._clock is not None:
+                self._clock.advance(self._timeout)
+            raise socket.timeout()
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def close(self):
+        self.closed = True
+        self._closed_event.set()
+
+
+def make_client(channel):
+    """Create a fake SSHClient that hands out the given channel."""
+    client = MagicMock()
+    client.invoke_shell.return_value = channel
+    client.get_transport.return_value.is_active.return_value = True
+    return client
+
+
+class TestPersistentSession:
+    """Test that commands share one SSH session."""
+
+    @pytest.mark.asyncio
+    async def test_commands_reuse_session(self):
+        """Two commands should only open one SSH connection."""
+        channel = FakeChannel([b"first output\r\n", b"second output\r\n"])
+        client = make_client(channel)
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=client) as client_cls:
+            assert await manager.execute_command("show version") == "first output"
+            assert await manager.execute_command("show interface brief") == "second output"
+
+        assert client_cls.call_count == 1
+        assert client.connect.call_count == 1
+        client.get_transport.return_value.set_keepalive.assert_called_once_with(ssh_module._SSH_KEEPALIVE_INTERVAL)
+
+    @pytest.mark.asyncio
+    async def test_reconnects_when_session_dropped(self):
+        """A dropped session should be reopened transparently."""
+        first = FakeChannel([b"first output\r\n"])
+        second = FakeChannel([b"second output\r\n"])
+        clients = [make_client(first), make_client(second)]
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", side_effect=clients):
+            assert await manager.execute_command("show version") == "first output"
+            first.closed = True
+            assert await manager.execute_command("show version") == "second output"
+
+        assert clients[0].close.called
+
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_working_config(self):
+        """After a legacy fallback, reconnects go straight to the config that worked."""
+        rejected = MagicMock()
+        rejected.connect.side_effect = ssh_module.paramiko.SSHException("no matching kex")
+        first = FakeChannel([b"first output\r\n"])
+        second = FakeChannel([b"second output\r\n"])
+        clients = [rejected, make_client(first), make_client(second)]
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", side_effect=clients):
+            assert await manager.execute_command("show version") == "first output"
+            first.closed = True
+            assert await manager.execute_command("show version") == "second output"
+
+        assert "disabled_algorithms" in clients[2].connect.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_captures_session_prompt(self):
+        """The switch's own prompt is learned at connect, including config contexts."""
+        channel = FakeChannel([b"output\r\n"])
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=make_client(channel)):
+            await manager.execute_command("show version")
+
+        assert manager._prompt_re.search("\r\nHP-2530-24G# ")
+        assert manager._prompt_re.search("\r\nHP-2530-24G(config)# ")
+        assert manager._prompt_re.search("\r\nHP-2530-24G(eth-1/5)# ")
+        assert not manager._prompt_re.search("\r\nOther-Switch# ")
+
+    @pytest.mark.asyncio
+    async def test_prompt_with_space_in_hostname(self, clock):
+        """Hostnames with spaces are learned literally, so reads still end at the prompt."""
+        channel = FakeChannel([b"output\r\n"], prompt=b"\r\nCore Switch# ", clock=clock)
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=make_client(channel)):
+            assert await manager.execute_command("show version") == "output"
+
+        # Every read ended at the prompt rather than waiting out its deadline
+        assert channel.timeouts == 0
+        assert manager._prompt_re.search("\r\nCore Switch(eth-1/5)# ")
+        assert not manager._prompt_re.search("\r\nSwitch# ")
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        """Closing the manager closes the session."""
+        channel = FakeChannel([b"output\r\n"])
+        client = make_client(channel)
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=client):
+            await manager.execute_command("show version")
+            await manager.close()
+
+        assert channel.closed
+        assert client.close.called
+        assert not manager._is_connected()
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_batch(self):
+        """A batch returns one output per command over a single session."""
+        channel = FakeChannel([b"interfaces\r\n", b"version\r\n"])
+        client = make_client(channel)
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=client) as client_cls:
+            outputs = await manager.execute_commands(["show interface brief", "show version"])
+
+        assert outputs == ["interfaces", "version"]
+        assert client_cls.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_timed_out_command_is_not_replayed(self):
+        """A timed-out batch is abandoned, not retried on a new session after the caller returns."""
+        channel = FakeChannel([b"warmup\r\n"], hang_on="configure", block_on_hang=True)
+        client = make_client(channel)
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        loop = asyncio.get_running_loop()
+
+        async def expire_once_hung(awaitable, timeout):
+            # The batch budget runs out while the worker is stuck waiting on 'configure'
+            await loop.run_in_executor(None, channel.hung.wait, 5)
+            awaitable.cancel()
+            raise asyncio.TimeoutError
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=client) as client_cls:
+            await manager.execute_command("show version")
+            with patch.object(ssh_module.asyncio, "wait_for", side_effect=expire_once_hung):
+                result = await manager.execute_command("configure\ninterface 5\ndisable\nexit\nexit")
+
+        assert result is None
+        # The worker had already given up on the closed session when the call returned
+        assert channel.released.is_set()
+        assert channel.sent[-1] == "configure\n"
+        assert client_cls.call_count == 1
+        assert not manager._is_connected()
+
+    @pytest.mark.asyncio
+    async def test_missing_prompt_fails_line_without_retry(self, clock):
+        """A line whose prompt never returns fails after timeout instead of sending the rest."""
+        channel = FakeChannel([b"warmup\r\n"], hang_on="power-over-ethernet", clock=clock)
+        client = make_client(channel)
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=client) as client_cls:
+            await manager.execute_command("show version")
+            clock.advance(1)
+            start = clock.monotonic()
+            result = await manager.execute_command("configure\ninterface 5\npower-over-ethernet\nexit\nexit", timeout=2)
+
+        assert result is None
+        # Gave up once the line's own timeout passed, not after the whole batch budget
+        assert 2 <= clock.monotonic() - start < 3
+        assert channel.sent[-1] == "power-over-ethernet\n"
+        assert client_cls.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_failure(self):
+        """A failed connection yields None for every command."""
+        client = MagicMock()
+        client.connect.side_effect = OSError("unreachable")
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+
+        with patch.object(ssh_module.paramiko, "SSHClient", return_value=client):
+            outputs = await manager.execute_commands(["show interface brief", "show version"])
+
+        assert outputs == [None, None]
+        assert await manager.is_switch_available() is False
+
+
+class TestSharedFetch:
+    """Test that concurrent data requests share one fetch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_fetch(self):
+        """Callers arriving while a fetch is running get its result."""
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+        release = asyncio.Event()
+        calls = 0
+
+        async def fake_fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"1": {}}, {}, {}, {}, {}
+
+        with patch.object(manager, "_fetch_all_switch_data", side_effect=fake_fetch):
+            first = asyncio.ensure_future(manager.get_all_switch_data())
+            second = asyncio.ensure_future(manager.get_all_switch_data())
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        assert calls == 1
+        assert results[0] == results[1]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_starts_new_fetch(self):
+        """A caller after invalidate_cache() doesn't join the older fetch."""
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+        release = asyncio.Event()
+        calls = 0
+
+        async def fake_fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {}, {}, {}, {}, {"version": calls}
+
+        with patch.object(manager, "_fetch_all_switch_data", side_effect=fake_fetch):
+            first = asyncio.ensure_future(manager.get_all_switch_data())
+            await asyncio.sleep(0)
+            manager.invalidate_cache()
+            second = asyncio.ensure_future(manager.get_all_switch_data())
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_recent_result_is_cached(self, clock):
+        """A second call within the TTL is served from cache until invalidated."""
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+        calls = 0
+
+        async def fake_fetch():
+            nonlocal calls
+            calls += 1
+            return {"1": {}}, {}, {}, {}, {}
+
+        with patch.object(manager, "_fetch_all_switch_data", side_effect=fake_fetch):
+            await manager.get_all_switch_data()
+            await manager.get_all_switch_data()
+            assert calls == 1
+
+            manager.invalidate_cache()
+            await manager.get_all_switch_data()
+            assert calls == 2
+
+            clock.advance(manager._cache_ttl - 1)
+            await manager.get_all_switch_data()
+            assert calls == 2
+
+            clock.advance(1)
+            await manager.get_all_switch_data()
+            assert calls == 3
+
+
+class TestPartialPolls:
+    """Test that 'show interface all' only runs on every Nth refresh."""
+
+    @pytest.mark.asyncio
+    async def test_brief_refreshes_link_state_between_full_polls(self):
+        """Between full polls the counters are reused and link state comes from brief."""
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+        manager._cache_ttl = 0
+        brief = (TEST_DATA / "show_interface_brief.txt").read_text()
+        outputs = {
+            "show interface all": (TEST_DATA / "show_interface_all.txt").read_text(),
+            "show interface brief": brief,
+            "show power-over-ethernet all": (TEST_DATA / "show_power_over_ethernet_all.txt").read_text(),
+            "show version": (TEST_DATA / "show_version.txt").read_text(),
+        }
+        sent = []
+
+        async def fake_execute_commands(commands, timeout=10):
+            sent.append(list(commands))
+            return [outputs[command] for command in commands]
+
+        with patch.object(manager, "execute_commands", side_effect=fake_execute_commands):
+            interfaces, statistics, _, _, _ = await manager.get_all_switch_data()
+            assert interfaces["2"]["link_status"] == "down"
+
+            # Port 2 comes up; only the brief table reflects it until the next full poll
+            outputs["show interface brief"] = brief.replace(
+                "2     100/1000T  | No        Yes     Down", "2     100/1000T  | No        Yes     Up  "
+            )
+            interfaces2, statistics2, link_details2, _, _ = await manager.get_all_switch_data()
+
+            for _ in range(ssh_module._FULL_POLL_INTERVAL - 1):
+                await manager.get_all_switch_data()
+
+        assert "show interface all" in sent[0]
+        assert "show interface all" not in sent[1]
+        assert "show interface all" in sent[ssh_module._FULL_POLL_INTERVAL]
+        assert statistics2 == statistics
+        assert interfaces2["2"]["link_status"] == "up"
+        assert link_details2["2"]["link_up"] is True
+
+    @pytest.mark.asyncio
+    async def test_offline_between_full_polls_is_reported(self):
+        """Cached counters are not served as a successful poll when the switch stops answering."""
+        manager = ArubaSSHManager("192.168.1.100", "admin", "password")
+        manager._cache_ttl = 0
+        outputs = {
+            "show interface all": (TEST_DATA / "show_interface_all.txt").read_text(),
+            "show interface brief": (TEST_DATA / "show_interface_brief.txt").read_text(),
+            "show power-over-ethernet all": (TEST_DATA / "show_power_over_ethernet_all.txt").read_text(),
+            "show version": (TEST_DATA / "show_version.txt").read_text(),
+        }
+        online = True
+        sent = []
+
+        async def fake_execute_commands(commands, timeout=10):
+            sent.append(list(commands))
+            return [outputs[command] if online else None for command in commands]
+
+        with patch.object(manager, "execute_commands", side_effect=fake_execute_commands):
+            assert (await manager.get_current_data())["available"] is True
+
+            # Switch goes offline before the next full poll is due
+            online = False
+            for _ in range(ssh_module._FULL_POLL_INTERVAL + 1):
+                assert (await manager.get_current_data())["available"] is False
+
+            online = True
+            assert (await manager.get_current_data())["available"] is True
+
+        assert "show interface all" not in sent[1]
+        # The failed full poll is retried until one succeeds
+        assert "show interface all" in sent[ssh_module._FULL_POLL_INTERVAL]
+        assert "show interface all" in sent[-1]